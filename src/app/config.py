@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
 
     EMBEDDING_MODEL: str = "BAAI/bge-small-en-v1.5"
+
+    # Re-embedding migration throttling
+    REEMBED_BATCH_SIZE: int = 64
+    REEMBED_BATCH_DELAY: float = 0.5
     LLM_MODEL: str = "llama3.1:8b"
     LLM_TIMEOUT: float = 120.0
 
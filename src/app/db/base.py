@@ -36,6 +36,46 @@ class Database(metaclass=SingletonMeta):
         """Create all tables in the database if they don't exist."""
         async with self.engine.begin() as connection:
             await connection.run_sync(Base.metadata.create_all)
+        await self.upgrade_embedding_schema()
+
+    async def upgrade_embedding_schema(self):
+        """Tag pre-existing embeddings with their model and dimension, and relax the fixed vector size."""
+        async with self.engine.begin() as connection:
+            await connection.execute(text(
+                "ALTER TABLE document_embeddings ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(255);"
+            ))
+            await connection.execute(text(
+                "ALTER TABLE document_embeddings ADD COLUMN IF NOT EXISTS embedding_dim INTEGER;"
+            ))
+            await connection.execute(
+                text("""
+                    UPDATE document_embeddings
+                    SET embedding_model = :model, embedding_dim = vector_dims(embedding)
+                    WHERE embedding_model IS NULL;
+                """),
+                {"model": settings.EMBEDDING_MODEL},
+            )
+            await connection.execute(text(
+                "ALTER TABLE document_embeddings ALTER COLUMN embedding_model SET NOT NULL, "
+                "ALTER COLUMN embedding_dim SET NOT NULL;"
+            ))
+
+            # Only rewrite the column type when it is still pinned to a fixed dimension
+            result = await connection.execute(text("""
+                SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+                WHERE attrelid = 'document_embeddings'::regclass AND attname = 'embedding';
+            """))
+            if result.scalar() != "vector":
+                await connection.execute(text("ALTER TABLE document_embeddings ALTER COLUMN embedding TYPE vector;"))
+
+            await connection.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_document_embeddings_chunk_model
+                ON document_embeddings (document_id, chunk_index, embedding_model);
+            """))
+            await connection.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_document_embeddings_model_id
+                ON document_embeddings (embedding_model, id);
+            """))
 
 # Singleton Database Instance
 db_instance = Database()
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON, TIMESTAMP, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, TIMESTAMP, Text, Index, text
 from sqlalchemy.orm import relationship, declarative_base
 from pgvector.sqlalchemy import Vector
 from datetime import datetime
 
 Base = declarative_base()
 
+# Migration states that still own a target space; at most one migration may be in one of these
+UNFINISHED_MIGRATION_STATUSES = ("pending", "running", "cutover", "failed")
+
 class Document(Base):
     __tablename__ = "documents"
 
@@ -26,11 +29,54 @@ class DocumentEmbedding(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     chunk_index = Column(Integer, nullable=False)
-    embedding = Column(Vector(384), nullable=False)
+    # Untyped vector so that spaces of different dimensions can coexist during a re-embedding migration
+    embedding = Column(Vector(), nullable=False)
+    embedding_model = Column(String(255), nullable=False)
+    embedding_dim = Column(Integer, nullable=False)
     chunk_text = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
 
     document = relationship("Document", back_populates="embeddings")
 
+    __table_args__ = (
+        Index("uq_document_embeddings_chunk_model", "document_id", "chunk_index", "embedding_model", unique=True),
+        # Serves per-space scans: the active-space filter on retrieval and keyset batches during migrations
+        Index("ix_document_embeddings_model_id", "embedding_model", "id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<DocumentEmbedding(document_id={self.document_id}, chunk_index={self.chunk_index}, "
+            f"embedding_model={self.embedding_model})>"
+        )
+
+class EmbeddingMigration(Base):
+    """Tracks a re-embedding job that moves all chunks from one embedding space to another."""
+    __tablename__ = "embedding_migrations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_model = Column(String(255), nullable=False)
+    target_model = Column(String(255), nullable=False)
+    target_dim = Column(Integer, nullable=False)
+    # pending -> running -> cutover -> completed; failed jobs resume from last_embedding_id, or get cancelled
+    status = Column(String(32), nullable=False, default="pending")
+    last_embedding_id = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    total_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    # Set once queries have switched to the target space; the latest cutover defines the active space
+    cutover_at = Column(TIMESTAMP, nullable=True)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "uq_embedding_migrations_unfinished",
+            text("(true)"),
+            unique=True,
+            postgresql_where=status.in_(UNFINISHED_MIGRATION_STATUSES),
+        ),
+    )
+
     def __repr__(self):
-        return f"<DocumentEmbedding(document_id={self.document_id}, chunk_index={self.chunk_index})>"
+        return f"<EmbeddingMigration(source_model={self.source_model}, target_model={self.target_model}, status={self.status})>"
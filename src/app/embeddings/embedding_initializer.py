@@ -1,3 +1,5 @@
+import threading
+from typing import Optional
 from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 from llama_index.core import Settings
 from app.utils.singleton import SingletonMeta
@@ -7,11 +9,25 @@ class EmbeddingService(metaclass=SingletonMeta):
     """Singleton for embedding model initialization using SingletonMeta."""
 
     def __init__(self):
-        """Initialize the embedding model only once."""
-        if not hasattr(self, "embedding_model"):
-            self.embedding_model = HuggingFaceEmbedding(model_name=settings.EMBEDDING_MODEL)
-            Settings.embed_model = self.embedding_model
+        """Initialize the configured embedding model only once."""
+        if not hasattr(self, "models"):
+            embedding_model = HuggingFaceEmbedding(model_name=settings.EMBEDDING_MODEL)
+            Settings.embed_model = embedding_model
+            self.models = {settings.EMBEDDING_MODEL: embedding_model}
+            # Models are loaded from executor threads, so guard the cache
+            self.models_lock = threading.Lock()
 
-    def get_embedding_model(self):
-        """Return the embedding model instance."""
-        return self.embedding_model
\ No newline at end of file
+    def get_embedding_model(self, model_name: Optional[str] = None):
+        """Return an embedding model instance, loading it on first use. Defaults to the configured model."""
+        model_name = model_name or settings.EMBEDDING_MODEL
+        with self.models_lock:
+            if model_name not in self.models:
+                self.models[model_name] = HuggingFaceEmbedding(model_name=model_name)
+            return self.models[model_name]
+
+    def evict_embedding_model(self, model_name: str):
+        """Drop a model that no longer backs an embedding space so its memory can be reclaimed."""
+        with self.models_lock:
+            embedding_model = self.models.pop(model_name, None)
+            if embedding_model is not None and Settings.embed_model is embedding_model and self.models:
+                Settings.embed_model = next(iter(self.models.values()))
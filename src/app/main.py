@@ -1,17 +1,31 @@
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.routes import ingestion, qna, test
+from app.db.base import db_instance
+from app.routes import embeddings, ingestion, qna, test
+from app.services.embedding_service import load_embedding_model
+from app.services.reembedding_service import get_active_embedding_model
 
 # Configure the logger
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create tables, upgrade the embedding schema and preload the active embedding model before serving requests."""
+    await db_instance.enable_pgvector()
+    await db_instance.create_tables()
+    async with db_instance.SessionLocal() as db:
+        await load_embedding_model(await get_active_embedding_model(db))
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 # Include route handlers
 app.include_router(test.router, tags=["Test"])
 app.include_router(ingestion.router, tags=["Ingestion"])
 app.include_router(qna.router, prefix="/qna", tags=["QnA"])
+app.include_router(embeddings.router, prefix="/embeddings", tags=["Embeddings"])
 
 # Log application startup
 logger.info("FastAPI is running with debugging enabled.")
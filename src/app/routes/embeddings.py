@@ -0,0 +1,81 @@
+import logging
+from fastapi import APIRouter, Form, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.base import get_db
+from app.services.reembedding_service import (
+    cancel_migration,
+    create_migration,
+    get_active_embedding_model,
+    get_migration,
+    is_migration_running,
+    launch_migration,
+    migration_progress,
+    resumed_status,
+)
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.get("/active")
+async def active_embedding_space(db: AsyncSession = Depends(get_db)):
+    """API to report which embedding model currently serves retrieval."""
+    return {"embedding_model": await get_active_embedding_model(db)}
+
+@router.post("/migrations")
+async def start_migration(
+    target_model: str = Form(...),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    API to start re-embedding every chunk with `target_model` in the background.
+    Queries keep reading the current space until the new one is complete.
+    """
+    migration = await create_migration(db, target_model)
+    launch_migration(migration.id)
+    return migration_progress(migration)
+
+@router.get("/migrations/{migration_id}")
+async def migration_status(migration_id: int, db: AsyncSession = Depends(get_db)):
+    """API to report the progress of a re-embedding migration."""
+    migration = await get_migration(db, migration_id)
+    if not migration:
+        raise HTTPException(status_code=404, detail="Migration not found.")
+    return migration_progress(migration)
+
+@router.post("/migrations/{migration_id}/resume")
+async def resume_migration(migration_id: int, db: AsyncSession = Depends(get_db)):
+    """API to resume an interrupted or failed migration from its last committed batch."""
+    migration = await get_migration(db, migration_id)
+    if not migration:
+        raise HTTPException(status_code=404, detail="Migration not found.")
+    if migration.status in ("completed", "cancelled"):
+        raise HTTPException(status_code=400, detail=f"Migration is already {migration.status}.")
+    if not launch_migration(migration.id):
+        raise HTTPException(status_code=409, detail="Migration is already running.")
+
+    # The job persists the same transition once it starts; report it now rather than the stale failure
+    progress = migration_progress(migration)
+    progress.update(status=resumed_status(migration), error=None)
+    return progress
+
+@router.delete("/migrations/{migration_id}")
+async def abandon_migration(migration_id: int, db: AsyncSession = Depends(get_db)):
+    """API to cancel a failed migration before cutover and remove its partial embeddings."""
+    migration = await get_migration(db, migration_id)
+    if not migration:
+        raise HTTPException(status_code=404, detail="Migration not found.")
+    if migration.status != "failed" or migration.cutover_at is not None:
+        raise HTTPException(status_code=400, detail="Only failed migrations that have not cut over can be cancelled.")
+    # A just-resumed job may not have recorded that it is running yet
+    if is_migration_running(migration.id):
+        raise HTTPException(status_code=409, detail="Migration is running.")
+
+    try:
+        await cancel_migration(db, migration)
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error cancelling migration {migration_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to cancel migration.")
+    return migration_progress(migration)
@@ -2,7 +2,8 @@ from fastapi import APIRouter, UploadFile, Form, File, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.base import get_db
 from app.db.models import Document, DocumentEmbedding
-from app.services.embedding_service import chunk_and_generate_embeddings, extract_text_from_pdf
+from app.services.embedding_service import chunk_and_generate_embeddings, extract_text_from_pdf, generate_embeddings
+from app.services.reembedding_service import get_active_embedding_model, lock_embedding_spaces
 import json
 import uuid
 from datetime import datetime
@@ -34,8 +35,18 @@ async def ingest_document(
         await db.commit()
         await db.refresh(new_document)
 
+        embedding_model = await get_active_embedding_model(db)
+
         # Chunk the extracted text and generate embeddings for the chunks
-        chunks, chunk_embeddings = await chunk_and_generate_embeddings(extracted_text)
+        chunks, chunk_embeddings = await chunk_and_generate_embeddings(extracted_text, embedding_model)
+
+        # Hold the space lock until commit so a concurrent cutover cannot strand these chunks in the old space
+        await lock_embedding_spaces(db)
+        active_model = await get_active_embedding_model(db)
+        if active_model != embedding_model:
+            # A cutover landed while encoding; only then re-embed under the lock
+            embedding_model = active_model
+            chunk_embeddings = await generate_embeddings(chunks, embedding_model)
 
         # Create document embedding records for each chunk
         embedding_records = [
@@ -43,6 +54,8 @@ async def ingest_document(
                 document_id=new_document.id,
                 chunk_index=i,
                 embedding=emb,
+                embedding_model=embedding_model,
+                embedding_dim=len(emb),
                 chunk_text=chunk,
             )
             for i, (chunk, emb) in enumerate(zip(chunks, chunk_embeddings))
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, FastAPI
 from app.llm.llm_initializer import LLMService
-from app.embeddings.embedding_initializer import EmbeddingService
+from app.services.embedding_service import load_embedding_model
+from app.services.reembedding_service import get_active_embedding_model
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 from app.db.base import db_instance, get_db
@@ -50,11 +51,11 @@ async def test_llm():
 
 # Test Embedding model route
 @router.get("/test_embedding")
-async def test_embedding():
-    """Test Embedding Model."""
+async def test_embedding(db: AsyncSession = Depends(get_db)):
+    """Test the active Embedding Model."""
     try:
-        embedding_instance = EmbeddingService()
-        vector = await embedding_instance.get_embedding_model().aget_text_embedding("Hello, world!")
+        embedding_model = await load_embedding_model(await get_active_embedding_model(db))
+        vector = await embedding_model.aget_text_embedding("Hello, world!")
         return {"status": "Embedding Model Loaded", "vector_sample": vector[:5]} 
     except Exception as e:
         return {"status": "Embedding Model Initialization failed", "error": str(e)}
@@ -1,11 +1,11 @@
 import asyncio
+from typing import Optional
 from pypdf import PdfReader
 from app.embeddings.embedding_initializer import EmbeddingService
 from llama_index.core.node_parser import TokenTextSplitter
 
 # Initialize Embedding Model Singleton
 embedding_instance = EmbeddingService()
-embedding_model = embedding_instance.get_embedding_model()
 
 async def extract_text_from_pdf(file) -> str:
     """Extract text from a PDF asynchronously using a thread executor."""
@@ -15,16 +15,28 @@ async def extract_text_from_pdf(file) -> str:
         page.extract_text() or "" for page in PdfReader(file.file).pages 
     ]).strip())
 
-async def generate_embeddings(chunks: list[str]) -> list:
-    """Generate embeddings asynchronously for all document chunks."""
+async def generate_embeddings(chunks: list[str], model_name: Optional[str] = None) -> list:
+    """Generate embeddings asynchronously for all document chunks, optionally with a specific model."""
+    model = embedding_instance.get_embedding_model(model_name)
     # Gather embeddings for all chunks concurrently
-    return await asyncio.gather(*[embedding_model.aget_text_embedding(chunk) for chunk in chunks])
+    return await asyncio.gather(*[model.aget_text_embedding(chunk) for chunk in chunks])
 
-async def chunk_and_generate_embeddings(extracted_text: str):
+async def load_embedding_model(model_name: Optional[str] = None):
+    """Resolve an embedding model, loading it in a thread executor on first use."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, embedding_instance.get_embedding_model, model_name)
+
+async def generate_embeddings_in_executor(chunks: list[str], model_name: Optional[str] = None) -> list:
+    """Generate embeddings for a batch in a thread executor so long-running jobs don't stall the event loop."""
+    model = await load_embedding_model(model_name)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, model.get_text_embedding_batch, chunks)
+
+async def chunk_and_generate_embeddings(extracted_text: str, model_name: Optional[str] = None):
     """Chunk the extracted text and generate embeddings asynchronously."""
     # Initialize the text splitter for chunking the extracted text
     text_splitter = TokenTextSplitter(chunk_size=512, chunk_overlap=50)
     chunks = text_splitter.split_text(extracted_text)
     # Generate embeddings concurrently for all chunks
-    chunk_embeddings = await generate_embeddings(chunks)
+    chunk_embeddings = await generate_embeddings(chunks, model_name)
     return chunks, chunk_embeddings
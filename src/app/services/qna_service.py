@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from functools import lru_cache
 from typing import List, Optional
@@ -5,8 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 from fastapi import HTTPException
 from app.llm.llm_initializer import LLMService
-from app.services.embedding_service import embedding_model
+from app.services.embedding_service import embedding_instance
 from app.services.prompt_templates import QA_TEMPLATE
+from app.services.reembedding_service import get_active_embedding_model
 
 # Initialize Logger
 logger = logging.getLogger(__name__)
@@ -16,9 +18,9 @@ llm_instance = LLMService()
 llm_model = llm_instance.get_llm()
 
 @lru_cache(maxsize=1000)
-def get_text_embedding_cached(text: str):
-    """Caches text embeddings to reduce redundant computations."""
-    return embedding_model.get_text_embedding(text)
+def get_text_embedding_cached(text: str, model_name: str):
+    """Caches text embeddings per model to reduce redundant computations."""
+    return embedding_instance.get_embedding_model(model_name).get_text_embedding(text)
 
 async def retrieve_similar_chunks(
     query: str, top_k: int, db: AsyncSession, document_names: Optional[List[str]] = None
@@ -26,10 +28,15 @@ async def retrieve_similar_chunks(
     """
     Retrieve top_k most similar document chunks asynchronously using pgvector.
     Supports optional filtering by document names.
+    Only the active embedding space is searched, so an in-progress re-embedding migration is invisible to queries.
     """
     try:
+        embedding_model = await get_active_embedding_model(db)
+
         logger.debug("Generating Query Embedding...")
-        query_embedding = get_text_embedding_cached(query)
+        # After a cutover the active model may not be loaded yet; loading and encoding both block
+        loop = asyncio.get_running_loop()
+        query_embedding = await loop.run_in_executor(None, get_text_embedding_cached, query, embedding_model)
 
         if not query_embedding:
             raise HTTPException(status_code=400, detail="Failed to generate query embedding.")
@@ -45,12 +52,13 @@ async def retrieve_similar_chunks(
                    1 - (document_embeddings.embedding <=> ARRAY[{}]::vector) AS similarity
             FROM document_embeddings
             JOIN documents ON document_embeddings.document_id = documents.id
+            WHERE document_embeddings.embedding_model = :embedding_model
         """.format(query_embedding_str)
 
-        query_params = {"top_k": top_k}
+        query_params = {"top_k": top_k, "embedding_model": embedding_model}
 
         if document_names:
-            base_query += " WHERE documents.title = ANY(:document_names)"
+            base_query += " AND documents.title = ANY(:document_names)"
             query_params["document_names"] = document_names
 
         base_query += """
@@ -0,0 +1,300 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import select, delete, func, exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import text
+from app.config import settings
+from app.db.base import db_instance
+from app.db.models import DocumentEmbedding, EmbeddingMigration, UNFINISHED_MIGRATION_STATUSES
+from app.services.embedding_service import embedding_instance, generate_embeddings_in_executor
+
+# Initialize Logger
+logger = logging.getLogger(__name__)
+
+# Advisory lock guarding the active embedding space: ingestion holds it shared, cutover exclusively
+EMBEDDING_SPACE_LOCK_KEY = 384_001
+
+# Keep references to in-process jobs so they are not garbage collected and cannot run twice
+_running_jobs: dict[int, asyncio.Task] = {}
+
+async def lock_embedding_spaces(db: AsyncSession, exclusive: bool = False):
+    """Take the embedding space advisory lock for the rest of the current transaction."""
+    lock_fn = "pg_advisory_xact_lock" if exclusive else "pg_advisory_xact_lock_shared"
+    await db.execute(text(f"SELECT {lock_fn}(:key)"), {"key": EMBEDDING_SPACE_LOCK_KEY})
+
+async def get_active_embedding_model(db: AsyncSession) -> str:
+    """Return the model whose space serves queries: the target of the latest cutover, else the configured model."""
+    result = await db.execute(
+        select(EmbeddingMigration.target_model)
+        .where(EmbeddingMigration.cutover_at.is_not(None))
+        .order_by(EmbeddingMigration.cutover_at.desc())
+        .limit(1)
+    )
+    return result.scalar() or settings.EMBEDDING_MODEL
+
+async def get_migration(db: AsyncSession, migration_id: int) -> Optional[EmbeddingMigration]:
+    """Fetch a migration by id."""
+    return await db.get(EmbeddingMigration, migration_id)
+
+async def get_unfinished_migration(db: AsyncSession) -> Optional[EmbeddingMigration]:
+    """Return the migration that has not reached a terminal state, if any."""
+    result = await db.execute(
+        select(EmbeddingMigration).where(EmbeddingMigration.status.in_(UNFINISHED_MIGRATION_STATUSES)).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+async def create_migration(db: AsyncSession, target_model: str) -> EmbeddingMigration:
+    """
+    Validate the target model and record a pending migration from the active space.
+    The early check is only a fast path; a partial unique index rejects a concurrent second migration.
+    """
+    unfinished = await get_unfinished_migration(db)
+    if unfinished:
+        raise HTTPException(
+            status_code=409, detail=f"Migration {unfinished.id} is still {unfinished.status}."
+        )
+
+    source_model = await get_active_embedding_model(db)
+    if target_model == source_model:
+        raise HTTPException(status_code=400, detail=f"'{target_model}' is already the active embedding model.")
+
+    try:
+        # Loading and encoding are blocking, so keep them off the event loop
+        target_dim = len((await generate_embeddings_in_executor(["dimension probe"], target_model))[0])
+    except Exception as e:
+        logger.error(f"Failed to load embedding model {target_model}: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Failed to load embedding model '{target_model}'.")
+
+    total = await db.execute(
+        select(func.count()).select_from(DocumentEmbedding).where(DocumentEmbedding.embedding_model == source_model)
+    )
+
+    migration = EmbeddingMigration(
+        source_model=source_model,
+        target_model=target_model,
+        target_dim=target_dim,
+        status="pending",
+        last_embedding_id=0,
+        processed_count=0,
+        total_count=total.scalar(),
+    )
+    db.add(migration)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Another embedding migration is already unfinished.")
+    await db.refresh(migration)
+    return migration
+
+async def cancel_migration(db: AsyncSession, migration: EmbeddingMigration):
+    """Abandon a failed migration that has not cut over and drop its partial target space."""
+    await _delete_space(db, migration.target_model)
+    migration.status = "cancelled"
+    await db.commit()
+    embedding_instance.evict_embedding_model(migration.target_model)
+
+def is_migration_running(migration_id: int) -> bool:
+    """Whether this process has a live job for the migration."""
+    task = _running_jobs.get(migration_id)
+    return task is not None and not task.done()
+
+def launch_migration(migration_id: int) -> bool:
+    """Start (or resume) the background job for a migration; returns False if it is already running."""
+    if is_migration_running(migration_id):
+        return False
+    _running_jobs[migration_id] = asyncio.create_task(run_reembedding_migration(migration_id))
+    return True
+
+def resumed_status(migration: EmbeddingMigration) -> str:
+    """Status a migration takes when its job (re)starts: cleanup-only jobs stay in cutover."""
+    return "cutover" if migration.cutover_at else "running"
+
+def migration_progress(migration: EmbeddingMigration) -> dict:
+    """Serialize a migration's progress for the API."""
+    if migration.total_count:
+        percent = min(100.0, round(100 * migration.processed_count / migration.total_count, 2))
+    else:
+        percent = 100.0 if migration.status in ("cutover", "completed") else 0.0
+
+    return {
+        "migration_id": migration.id,
+        "source_model": migration.source_model,
+        "target_model": migration.target_model,
+        "target_dim": migration.target_dim,
+        "status": migration.status,
+        "processed": migration.processed_count,
+        "total": migration.total_count,
+        "percent": percent,
+        "last_embedding_id": migration.last_embedding_id,
+        "cutover_at": migration.cutover_at.isoformat() if migration.cutover_at else None,
+        "error": migration.error,
+    }
+
+async def run_reembedding_migration(migration_id: int):
+    """
+    Background job: backfill the target space, cut queries over to it, then drop the source space.
+    Every step commits its progress, so a failed or interrupted job can be resumed.
+    """
+    async with db_instance.SessionLocal() as db:
+        migration = await get_migration(db, migration_id)
+        if migration.status in ("completed", "cancelled"):
+            return
+
+        try:
+            migration.status = resumed_status(migration)
+            migration.error = None
+            await db.commit()
+
+            if migration.cutover_at is None:
+                if not await _backfill(db, migration) or not await _cutover(db, migration):
+                    logger.info(f"Embedding migration {migration_id} was cancelled; stopping.")
+                    return
+
+            await _delete_space(db, migration.source_model)
+            migration.status = "completed"
+            await db.commit()
+            embedding_instance.evict_embedding_model(migration.source_model)
+            logger.info(f"Embedding migration {migration_id} completed.")
+
+        except Exception as e:
+            logger.error(f"Embedding migration {migration_id} failed: {str(e)}")
+            await db.rollback()
+            migration = await get_migration(db, migration_id)
+            migration.status = "failed"
+            migration.error = str(e)
+            await db.commit()
+
+async def _reembed_rows(db: AsyncSession, migration: EmbeddingMigration, rows):
+    """Embed a batch of source chunks with the target model and insert them into the target space."""
+    embeddings = await generate_embeddings_in_executor([row.chunk_text for row in rows], migration.target_model)
+
+    for emb in embeddings:
+        if len(emb) != migration.target_dim:
+            raise ValueError(f"Expected {migration.target_dim}-dimensional embeddings, got {len(emb)}.")
+
+    # Chunks already present in the target space (e.g. from a resumed batch) are skipped
+    await db.execute(
+        insert(DocumentEmbedding)
+        .values([
+            {
+                "document_id": row.document_id,
+                "chunk_index": row.chunk_index,
+                "chunk_text": row.chunk_text,
+                "embedding": emb,
+                "embedding_model": migration.target_model,
+                "embedding_dim": migration.target_dim,
+                "created_at": datetime.utcnow(),
+            }
+            for row, emb in zip(rows, embeddings)
+        ])
+        .on_conflict_do_nothing(index_elements=["document_id", "chunk_index", "embedding_model"])
+    )
+
+async def _is_cancelled(db: AsyncSession, migration: EmbeddingMigration) -> bool:
+    """Re-read the migration's status, which a cancel request may have changed under the job."""
+    await db.refresh(migration, ["status"])
+    return migration.status == "cancelled"
+
+async def _backfill(db: AsyncSession, migration: EmbeddingMigration) -> bool:
+    """
+    Walk the source space in keyset-paginated, throttled batches, persisting the cursor after each.
+    Returns False if the migration was cancelled along the way.
+    """
+    while True:
+        if await _is_cancelled(db, migration):
+            return False
+
+        result = await db.execute(
+            select(
+                DocumentEmbedding.id,
+                DocumentEmbedding.document_id,
+                DocumentEmbedding.chunk_index,
+                DocumentEmbedding.chunk_text,
+            )
+            .where(
+                DocumentEmbedding.embedding_model == migration.source_model,
+                DocumentEmbedding.id > migration.last_embedding_id,
+            )
+            .order_by(DocumentEmbedding.id)
+            .limit(settings.REEMBED_BATCH_SIZE)
+        )
+        rows = result.all()
+        if not rows:
+            return True
+
+        await _reembed_rows(db, migration, rows)
+        migration.last_embedding_id = rows[-1].id
+        migration.processed_count += len(rows)
+        await db.commit()
+
+        await asyncio.sleep(settings.REEMBED_BATCH_DELAY)
+
+async def _cutover(db: AsyncSession, migration: EmbeddingMigration) -> bool:
+    """
+    Atomically switch queries to the target space. Ingestion is blocked while the exclusive lock is held,
+    so any source chunks still missing from the target space (including ones committed out of id order
+    during the backfill) are embedded in the same transaction that flips the active space.
+    Returns False without switching if the migration was cancelled.
+    """
+    await lock_embedding_spaces(db, exclusive=True)
+    if await _is_cancelled(db, migration):
+        await db.rollback()
+        return False
+
+    target = aliased(DocumentEmbedding)
+    result = await db.execute(
+        select(
+            DocumentEmbedding.id,
+            DocumentEmbedding.document_id,
+            DocumentEmbedding.chunk_index,
+            DocumentEmbedding.chunk_text,
+        )
+        .where(
+            DocumentEmbedding.embedding_model == migration.source_model,
+            ~exists().where(
+                target.document_id == DocumentEmbedding.document_id,
+                target.chunk_index == DocumentEmbedding.chunk_index,
+                target.embedding_model == migration.target_model,
+            ),
+        )
+        .order_by(DocumentEmbedding.id)
+    )
+    rows = result.all()
+
+    for start in range(0, len(rows), settings.REEMBED_BATCH_SIZE):
+        await _reembed_rows(db, migration, rows[start:start + settings.REEMBED_BATCH_SIZE])
+
+    if rows:
+        migration.last_embedding_id = max(migration.last_embedding_id, rows[-1].id)
+        migration.processed_count += len(rows)
+    migration.status = "cutover"
+    migration.cutover_at = datetime.utcnow()
+    await db.commit()
+    return True
+
+async def _delete_space(db: AsyncSession, model_name: str):
+    """Delete every embedding of a space in throttled batches."""
+    while True:
+        batch = (
+            select(DocumentEmbedding.id)
+            .where(DocumentEmbedding.embedding_model == model_name)
+            .order_by(DocumentEmbedding.id)
+            .limit(settings.REEMBED_BATCH_SIZE)
+        )
+        result = await db.execute(
+            delete(DocumentEmbedding)
+            .where(DocumentEmbedding.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if result.rowcount == 0:
+            return
+
+        await asyncio.sleep(settings.REEMBED_BATCH_DELAY)
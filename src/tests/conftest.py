@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.main import app
 from app.db.base import get_db, db_instance
+from app.db.models import EmbeddingMigration
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -24,4 +25,24 @@ async def test_db() -> AsyncSession:
 @pytest.fixture(scope="module")
 def client():
     """FastAPI Test Client for API testing."""
-    return TestClient(app)
\ No newline at end of file
+    return TestClient(app)
+
+@pytest.fixture
+def make_migration():
+    """Factory for in-memory migration records, midway through their backfill by default."""
+    def factory(**overrides) -> EmbeddingMigration:
+        fields = dict(
+            id=1,
+            source_model="BAAI/bge-small-en-v1.5",
+            target_model="sentence-transformers/all-MiniLM-L6-v2",
+            target_dim=384,
+            status="running",
+            last_embedding_id=64,
+            processed_count=64,
+            total_count=128,
+            error=None,
+            cutover_at=None,
+        )
+        fields.update(overrides)
+        return EmbeddingMigration(**fields)
+    return factory
\ No newline at end of file
@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+
+def test_migration_status(client: TestClient, make_migration):
+    """Test `/embeddings/migrations/{id}` reports batch progress."""
+
+    with patch("app.routes.embeddings.get_migration", new=AsyncMock(return_value=make_migration())):
+        response = client.get("/embeddings/migrations/1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "running"
+    assert data["processed"] == 64
+    assert data["total"] == 128
+    assert data["percent"] == 50.0
+    assert data["cutover_at"] is None
+
+
+def test_migration_status_not_found(client: TestClient):
+    """Test `/embeddings/migrations/{id}` for an unknown migration."""
+
+    with patch("app.routes.embeddings.get_migration", new=AsyncMock(return_value=None)):
+        response = client.get("/embeddings/migrations/999")
+
+    assert response.status_code == 404
+
+
+def test_start_migration(client: TestClient, make_migration):
+    """Test `/embeddings/migrations` records a migration and launches the background job."""
+
+    with patch("app.routes.embeddings.create_migration", new=AsyncMock(return_value=make_migration(status="pending", processed_count=0, last_embedding_id=0))), \
+         patch("app.routes.embeddings.launch_migration", new=MagicMock(return_value=True)) as mock_launch:
+        response = client.post("/embeddings/migrations", data={"target_model": "sentence-transformers/all-MiniLM-L6-v2"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    mock_launch.assert_called_once_with(1)
+
+
+def test_start_migration_while_unfinished(client: TestClient):
+    """Test `/embeddings/migrations` is rejected while another migration is unfinished."""
+
+    conflict = HTTPException(status_code=409, detail="Migration 1 is still running.")
+    with patch("app.routes.embeddings.create_migration", new=AsyncMock(side_effect=conflict)), \
+         patch("app.routes.embeddings.launch_migration", new=MagicMock()) as mock_launch:
+        response = client.post("/embeddings/migrations", data={"target_model": "sentence-transformers/all-MiniLM-L6-v2"})
+
+    assert response.status_code == 409
+    assert mock_launch.called is False
+
+
+def test_resume_running_migration(client: TestClient, make_migration):
+    """Test `/embeddings/migrations/{id}/resume` refuses to start a job twice."""
+
+    with patch("app.routes.embeddings.get_migration", new=AsyncMock(return_value=make_migration())), \
+         patch("app.routes.embeddings.launch_migration", new=MagicMock(return_value=False)):
+        response = client.post("/embeddings/migrations/1/resume")
+
+    assert response.status_code == 409
+
+
+def test_resume_failed_migration(client: TestClient, make_migration):
+    """Test `/embeddings/migrations/{id}/resume` reports the resumed state instead of the stale failure."""
+
+    failed = make_migration(status="failed", error="connection reset")
+    with patch("app.routes.embeddings.get_migration", new=AsyncMock(return_value=failed)), \
+         patch("app.routes.embeddings.launch_migration", new=MagicMock(return_value=True)) as mock_launch:
+        response = client.post("/embeddings/migrations/1/resume")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "running"
+    assert data["error"] is None
+    mock_launch.assert_called_once_with(1)
+
+
+def test_cancel_migration_with_live_job(client: TestClient, make_migration):
+    """Test `DELETE /embeddings/migrations/{id}` refuses to cancel a job that was just resumed."""
+
+    failed = make_migration(status="failed", error="connection reset")
+    with patch("app.routes.embeddings.get_migration", new=AsyncMock(return_value=failed)), \
+         patch("app.routes.embeddings.is_migration_running", new=MagicMock(return_value=True)), \
+         patch("app.routes.embeddings.cancel_migration", new=AsyncMock()) as mock_cancel:
+        response = client.delete("/embeddings/migrations/1")
+
+    assert response.status_code == 409
+    assert mock_cancel.called is False
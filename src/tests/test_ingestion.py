@@ -1,7 +1,9 @@
 import json
 import os
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
+from app.db.base import get_db
 
 def test_ingest_document(client: TestClient):
     """Test `/ingest` API by uploading a PDF document."""
@@ -22,3 +24,67 @@ def test_ingest_document(client: TestClient):
     assert data["status"] == "success"
     assert "document_id" in data
     assert data["chunks_created"] > 0
+
+
+def fake_db():
+    """AsyncSession stand-in that assigns the new document an id on refresh."""
+    db = MagicMock()
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock(side_effect=lambda document: setattr(document, "id", 1))
+    return db
+
+
+def test_ingest_tags_active_embedding_space(client: TestClient):
+    """Test `/ingest` embeds with the active model before taking the space lock, and tags each chunk."""
+
+    db = fake_db()
+    client.app.dependency_overrides[get_db] = lambda: db
+
+    calls = []
+    active_model = "sentence-transformers/all-MiniLM-L6-v2"
+    embedded = (["a", "b"], [[0.1] * 384, [0.2] * 384])
+    try:
+        with patch("app.routes.ingestion.extract_text_from_pdf", new=AsyncMock(return_value="Some text.")), \
+             patch("app.routes.ingestion.lock_embedding_spaces", new=AsyncMock(side_effect=lambda db: calls.append("lock"))) as mock_lock, \
+             patch("app.routes.ingestion.get_active_embedding_model", new=AsyncMock(return_value=active_model)), \
+             patch("app.routes.ingestion.chunk_and_generate_embeddings", new=AsyncMock(side_effect=lambda *args: calls.append("embed") or embedded)) as mock_chunks, \
+             patch("app.routes.ingestion.generate_embeddings", new=AsyncMock()) as mock_reembed:
+            response = client.post("/ingest", files={"file": ("doc.pdf", b"%PDF", "application/pdf")})
+    finally:
+        client.app.dependency_overrides.pop(get_db)
+
+    assert response.status_code == 200, f"Error: {response.json()}"
+    assert calls == ["embed", "lock"]
+    mock_lock.assert_awaited_once_with(db)
+    mock_chunks.assert_awaited_once_with("Some text.", active_model)
+    assert mock_reembed.called is False
+
+    records = db.add_all.call_args.args[0]
+    assert [record.chunk_index for record in records] == [0, 1]
+    assert all(record.embedding_model == active_model for record in records)
+    assert all(record.embedding_dim == 384 for record in records)
+
+
+def test_ingest_reembeds_after_concurrent_cutover(client: TestClient):
+    """Test `/ingest` re-embeds under the lock when a cutover switched the active model while it was encoding."""
+
+    db = fake_db()
+    client.app.dependency_overrides[get_db] = lambda: db
+
+    old_model, new_model = "BAAI/bge-small-en-v1.5", "BAAI/bge-base-en-v1.5"
+    try:
+        with patch("app.routes.ingestion.extract_text_from_pdf", new=AsyncMock(return_value="Some text.")), \
+             patch("app.routes.ingestion.lock_embedding_spaces", new=AsyncMock()), \
+             patch("app.routes.ingestion.get_active_embedding_model", new=AsyncMock(side_effect=[old_model, new_model])), \
+             patch("app.routes.ingestion.chunk_and_generate_embeddings", new=AsyncMock(return_value=(["a"], [[0.1] * 384]))), \
+             patch("app.routes.ingestion.generate_embeddings", new=AsyncMock(return_value=[[0.1] * 768])) as mock_reembed:
+            response = client.post("/ingest", files={"file": ("doc.pdf", b"%PDF", "application/pdf")})
+    finally:
+        client.app.dependency_overrides.pop(get_db)
+
+    assert response.status_code == 200, f"Error: {response.json()}"
+    mock_reembed.assert_awaited_once_with(["a"], new_model)
+
+    records = db.add_all.call_args.args[0]
+    assert records[0].embedding_model == new_model
+    assert records[0].embedding_dim == 768
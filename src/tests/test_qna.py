@@ -1,8 +1,9 @@
 import pytest
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.qna_service import retrieve_similar_chunks
 
 
 @pytest.mark.asyncio
@@ -117,3 +118,26 @@ async def test_query_answering_llm_failure(client: TestClient, test_db: AsyncSes
 
     assert response.status_code == 500
     assert "LLM failed to generate a response" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_similar_chunks_filters_active_space():
+    """Test retrieval only searches the active embedding space, combined with the document name filter."""
+
+    result = MagicMock()
+    result.fetchall.return_value = [("Test Document", "Relevant chunk.", 0.9)]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+
+    active_model = "sentence-transformers/all-MiniLM-L6-v2"
+    with patch("app.services.qna_service.get_active_embedding_model", new=AsyncMock(return_value=active_model)), \
+         patch("app.services.qna_service.get_text_embedding_cached", new=MagicMock(return_value=[0.1, 0.2])) as mock_embed:
+        rows = await retrieve_similar_chunks("sample query", 3, db, ["Test Document"])
+
+    assert rows == [("Test Document", "Relevant chunk.", 0.9)]
+    mock_embed.assert_called_once_with("sample query", active_model)
+
+    sql, params = db.execute.await_args.args
+    assert "WHERE document_embeddings.embedding_model = :embedding_model" in str(sql)
+    assert "AND documents.title = ANY(:document_names)" in str(sql)
+    assert params == {"top_k": 3, "embedding_model": active_model, "document_names": ["Test Document"]}
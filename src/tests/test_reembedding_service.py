@@ -0,0 +1,277 @@
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from app.config import settings
+from app.services.reembedding_service import (
+    _backfill,
+    _cutover,
+    _reembed_rows,
+    cancel_migration,
+    get_active_embedding_model,
+    migration_progress,
+    run_reembedding_migration,
+)
+
+
+def chunk(embedding_id: int):
+    """A source-space row as selected by the backfill and cutover queries."""
+    return SimpleNamespace(id=embedding_id, document_id=1, chunk_index=embedding_id, chunk_text=f"chunk {embedding_id}")
+
+
+def rows_result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def fake_session(*results):
+    """AsyncSession stand-in whose `execute` returns `results` in order."""
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=list(results))
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    db.refresh = AsyncMock()
+    return db
+
+
+def cancel_on_refresh(migration):
+    """Side effect for `db.refresh` simulating a cancel request committed by another session."""
+    async def refresh(obj, attribute_names=None):
+        migration.status = "cancelled"
+    return refresh
+
+
+@pytest.fixture(autouse=True)
+def no_throttle(monkeypatch):
+    monkeypatch.setattr(settings, "REEMBED_BATCH_DELAY", 0)
+
+
+def job_patches(db, migration, cutover_result=True):
+    """Patch the job's session and steps so `run_reembedding_migration` only exercises its orchestration."""
+    db_instance = MagicMock()
+    db_instance.SessionLocal.return_value.__aenter__.return_value = db
+    return (
+        patch("app.services.reembedding_service.db_instance", new=db_instance),
+        patch("app.services.reembedding_service.get_migration", new=AsyncMock(return_value=migration)),
+        patch("app.services.reembedding_service._backfill", new=AsyncMock(return_value=True)),
+        patch("app.services.reembedding_service._cutover", new=AsyncMock(return_value=cutover_result)),
+        patch("app.services.reembedding_service._delete_space", new=AsyncMock()),
+        patch("app.services.reembedding_service.embedding_instance", new=MagicMock()),
+    )
+
+
+def test_migration_progress_empty_source(make_migration):
+    """Test progress of a migration whose source space is empty."""
+
+    assert migration_progress(make_migration(status="pending", total_count=0, processed_count=0))["percent"] == 0.0
+    assert migration_progress(make_migration(status="completed", total_count=0, processed_count=0))["percent"] == 100.0
+
+
+def test_migration_progress_clamped(make_migration):
+    """Test progress stays at 100% when chunks ingested mid-migration push processed past the initial total."""
+
+    progress = migration_progress(make_migration(processed_count=150, total_count=128))
+
+    assert progress["percent"] == 100.0
+    assert progress["processed"] == 150
+
+
+@pytest.mark.asyncio
+async def test_active_model_falls_back_to_settings():
+    """Test the configured model serves queries until a migration has cut over."""
+
+    result = MagicMock()
+    result.scalar.return_value = None
+    db = fake_session(result)
+
+    assert await get_active_embedding_model(db) == settings.EMBEDDING_MODEL
+
+
+@pytest.mark.asyncio
+async def test_active_model_after_cutover():
+    """Test the target of the latest cutover serves queries."""
+
+    result = MagicMock()
+    result.scalar.return_value = "sentence-transformers/all-MiniLM-L6-v2"
+    db = fake_session(result)
+
+    assert await get_active_embedding_model(db) == "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@pytest.mark.asyncio
+async def test_backfill_advances_keyset_cursor(make_migration):
+    """Test the backfill commits its cursor after every batch until the source space is exhausted."""
+
+    migration = make_migration(last_embedding_id=0, processed_count=0)
+    db = fake_session(rows_result([chunk(3), chunk(7)]), rows_result([chunk(9)]), rows_result([]))
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        assert await _backfill(db, migration) is True
+
+    assert mock_reembed.await_count == 2
+    assert db.commit.await_count == 2
+    assert migration.last_embedding_id == 9
+    assert migration.processed_count == 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_cursor(make_migration):
+    """Test a resumed backfill only selects source chunks after the persisted cursor."""
+
+    migration = make_migration(last_embedding_id=64, processed_count=64)
+    db = fake_session(rows_result([]))
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        await _backfill(db, migration)
+
+    params = db.execute.await_args.args[0].compile().params
+    assert 64 in params.values()
+    assert migration.source_model in params.values()
+    assert mock_reembed.called is False
+    assert migration.processed_count == 64
+
+
+@pytest.mark.asyncio
+async def test_backfill_stops_when_cancelled(make_migration):
+    """Test the backfill stops before its next batch once the migration has been cancelled."""
+
+    migration = make_migration()
+    db = fake_session()
+    db.refresh.side_effect = cancel_on_refresh(migration)
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        assert await _backfill(db, migration) is False
+
+    assert db.execute.called is False
+    assert mock_reembed.called is False
+    assert migration.last_embedding_id == 64
+
+
+@pytest.mark.asyncio
+async def test_cutover_embeds_missing_chunks(make_migration):
+    """Test cutover takes the exclusive lock, embeds chunks missing from the target space and flips the active space."""
+
+    migration = make_migration(last_embedding_id=64, processed_count=64)
+    db = fake_session(MagicMock(), rows_result([chunk(5), chunk(70)]))
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        assert await _cutover(db, migration) is True
+
+    assert "pg_advisory_xact_lock(" in str(db.execute.await_args_list[0].args[0])
+    mock_reembed.assert_awaited_once_with(db, migration, [chunk(5), chunk(70)])
+    assert migration.status == "cutover"
+    assert isinstance(migration.cutover_at, datetime)
+    assert migration.processed_count == 66
+    assert migration.last_embedding_id == 70
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cutover_with_complete_target_space(make_migration):
+    """Test cutover flips the active space without re-embedding when nothing is missing."""
+
+    migration = make_migration(last_embedding_id=128, processed_count=128)
+    db = fake_session(MagicMock(), rows_result([]))
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        await _cutover(db, migration)
+
+    assert mock_reembed.called is False
+    assert migration.cutover_at is not None
+    assert migration.processed_count == 128
+
+
+@pytest.mark.asyncio
+async def test_cutover_skipped_when_cancelled(make_migration):
+    """Test a cancelled migration never flips the active space and releases the exclusive lock."""
+
+    migration = make_migration()
+    db = fake_session(MagicMock())
+    db.refresh.side_effect = cancel_on_refresh(migration)
+
+    with patch("app.services.reembedding_service._reembed_rows", new=AsyncMock()) as mock_reembed:
+        assert await _cutover(db, migration) is False
+
+    db.rollback.assert_awaited_once()
+    assert db.commit.called is False
+    assert mock_reembed.called is False
+    assert migration.cutover_at is None
+
+
+@pytest.mark.asyncio
+async def test_reembed_rows_tags_target_space(make_migration):
+    """Test re-embedded chunks are inserted with the target model and dimension, skipping existing ones."""
+
+    migration = make_migration()
+    db = fake_session(MagicMock())
+
+    with patch("app.services.reembedding_service.generate_embeddings_in_executor", new=AsyncMock(return_value=[[0.1] * 384])):
+        await _reembed_rows(db, migration, [chunk(3)])
+
+    compiled = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (document_id, chunk_index, embedding_model) DO NOTHING" in str(compiled)
+    assert migration.target_model in compiled.params.values()
+    assert 384 in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_reembed_rows_dimension_mismatch(make_migration):
+    """Test a model producing vectors of an unexpected size fails the batch before anything is written."""
+
+    migration = make_migration()
+    db = fake_session()
+
+    with patch("app.services.reembedding_service.generate_embeddings_in_executor", new=AsyncMock(return_value=[[0.1] * 768])):
+        with pytest.raises(ValueError):
+            await _reembed_rows(db, migration, [chunk(3)])
+
+    assert db.execute.called is False
+
+
+@pytest.mark.asyncio
+async def test_completed_migration_evicts_source_model(make_migration):
+    """Test a finished migration drops the source space and unloads the source model."""
+
+    migration = make_migration()
+    db = fake_session()
+    session, get, backfill, cutover, delete_space, embedding_instance = job_patches(db, migration)
+
+    with session, get, backfill, cutover, delete_space as mock_delete, embedding_instance as mock_models:
+        await run_reembedding_migration(1)
+
+    assert migration.status == "completed"
+    mock_delete.assert_awaited_once_with(db, migration.source_model)
+    mock_models.evict_embedding_model.assert_called_once_with(migration.source_model)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_migration_keeps_source_space(make_migration):
+    """Test a job cancelled before cutover neither deletes the source space nor unloads its model."""
+
+    migration = make_migration()
+    db = fake_session()
+    session, get, backfill, cutover, delete_space, embedding_instance = job_patches(db, migration, cutover_result=False)
+
+    with session, get, backfill, cutover, delete_space as mock_delete, embedding_instance as mock_models:
+        await run_reembedding_migration(1)
+
+    assert mock_delete.called is False
+    assert mock_models.evict_embedding_model.called is False
+
+
+@pytest.mark.asyncio
+async def test_cancel_migration_evicts_target_model(make_migration):
+    """Test cancelling drops the partial target space and unloads the target model."""
+
+    migration = make_migration(status="failed")
+    db = fake_session()
+
+    with patch("app.services.reembedding_service._delete_space", new=AsyncMock()) as mock_delete, \
+         patch("app.services.reembedding_service.embedding_instance", new=MagicMock()) as mock_models:
+        await cancel_migration(db, migration)
+
+    assert migration.status == "cancelled"
+    mock_delete.assert_awaited_once_with(db, migration.target_model)
+    mock_models.evict_embedding_model.assert_called_once_with(migration.target_model)